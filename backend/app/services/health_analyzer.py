@@ -6,6 +6,7 @@ from datetime import datetime
 import cv2
 import librosa
 from scipy import signal
+from scipy.fft import rfft, rfftfreq
 from scipy.stats import linregress
 
 # mkm-core-ai 경로 추가 시도
@@ -108,10 +109,10 @@ class HealthAnalyzer:
             red_values = np.array(red_values)
             red_values = red_values - np.mean(red_values)  # DC 성분 제거
             
-            # FFT를 통한 주파수 분석
+            # FFT를 통한 주파수 분석 (실수 신호이므로 rFFT로 양의 주파수만 계산)
             if len(red_values) > 10:
-                fft = np.fft.fft(red_values)
-                freqs = np.fft.fftfreq(len(red_values), 1/30)  # 30fps 가정
+                fft = rfft(red_values)
+                freqs = rfftfreq(len(red_values), 1/30)  # 30fps 가정
                 
                 # 심박수 관련 주파수 대역 (0.8-3.0 Hz, 48-180 bpm)
                 heart_rate_mask = (freqs > 0.8) & (freqs < 3.0)
@@ -167,14 +168,14 @@ class HealthAnalyzer:
             print(f"⚠️ Voice 향상 분석 실패: {e}")
             return voice_result
     
-    def _calculate_simple_hrv(self, signal: np.ndarray) -> float:
+    def _calculate_simple_hrv(self, signal_data: np.ndarray) -> float:
         """간단한 HRV 계산"""
         try:
-            if len(signal) < 20:
+            if len(signal_data) < 20:
                 return 50.0  # 기본값
             
             # 피크 검출
-            peaks, _ = signal.find_peaks(signal, height=np.mean(signal), distance=5)
+            peaks, _ = signal.find_peaks(signal_data, height=np.mean(signal_data), distance=5)
             
             if len(peaks) < 3:
                 return 50.0
@@ -188,15 +189,15 @@ class HealthAnalyzer:
         except Exception:
             return 50.0
     
-    def _assess_rppg_signal_quality(self, signal: np.ndarray) -> str:
+    def _assess_rppg_signal_quality(self, signal_data: np.ndarray) -> str:
         """RPPG 신호 품질 평가"""
         try:
-            if len(signal) < 10:
+            if len(signal_data) < 10:
                 return "poor"
             
             # 신호 대 잡음비 (SNR) 계산
-            signal_power = np.var(signal)
-            noise_power = np.var(np.diff(signal))
+            signal_power = np.var(signal_data)
+            noise_power = np.var(np.diff(signal_data))
             
             if noise_power == 0:
                 snr = float('inf')
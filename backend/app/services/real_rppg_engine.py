@@ -8,26 +8,70 @@ import cv2
 import numpy as np
 import mediapipe as mp
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
 from scipy import signal
-from scipy.fft import fft, fftfreq
+from scipy.ndimage import uniform_filter1d
+from scipy.fft import rfft, next_fast_len
+from functools import lru_cache
 import json
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=8)
+def _rfft_band_bins(n: int, sample_rate: float, low_hz: float, high_hz: float) -> Tuple[int, int, float]:
+    """길이 n rFFT에서 [low_hz, high_hz] 대역에 속하는 첫/마지막 빈 인덱스와 빈 간격(Hz) (신호 길이별 캐시)"""
+    bin_width = sample_rate / n
+    return int(np.ceil(low_hz / bin_width)), min(int(np.floor(high_hz / bin_width)), n // 2), bin_width
+
+@lru_cache(maxsize=8)
+def _hann_window(n: int) -> np.ndarray:
+    """길이 n의 Hann 창 (float32, 신호 길이별 캐시, 읽기 전용)"""
+    window = np.hanning(n).astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+def _landmark_indices(indices: List[int]) -> np.ndarray:
+    """읽기 전용 랜드마크 인덱스 배열 생성 (중복 제거, 오름차순 정렬)"""
+    array = np.unique(np.asarray(indices, dtype=np.int32))
+    array.flags.writeable = False
+    return array
+
 class RealRPPGEngine:
     """실제 rPPG 엔진 - MediaPipe 기반 고품질 구현"""
-    
+
+    # 스트레스 점수(0.1 단위, -1..8)별 등급: <3 낮음, 3-5 보통, >=6 높음
+    _STRESS_LEVELS = ("낮음",) * 4 + ("보통",) * 3 + ("높음",) * 3
+
+    # 신호 품질 임계값 테이블 (np.searchsorted 구간 인덱스 → 점수/등급)
+    _SNR_BINS = np.array([0.0, 5.0, 10.0])
+    _SNR_SCORES = (0.1, 0.2, 0.3, 0.4)
+    _CV_BINS = np.array([0.1, 0.2, 0.3])
+    _CV_SCORES = (0.3, 0.2, 0.1, 0.0)
+    _QUALITY_BINS = np.array([0.4, 0.6, 0.8])
+    _QUALITY_GRADES = ("Poor", "Fair", "Good", "Excellent")
+
+    # 얼굴 영역 정의 (MediaPipe 랜드마크 인덱스) - 모든 인스턴스가 공유
+    # ROI 마스크는 볼록 껍질로 채우므로 인덱스 순서는 영역 모양에 영향을 주지 않음
+    forehead_landmarks = _landmark_indices([10, 338, 297, 332, 284, 251, 389, 356, 454, 323])
+    cheek_landmarks = _landmark_indices([116, 117, 118, 119, 120, 121, 126, 142, 143, 144, 145, 146, 147])
+    nose_landmarks = _landmark_indices([1, 2, 5, 4, 6, 19, 20, 94, 125, 141, 235, 236, 3, 51, 48, 115, 131, 134, 102, 49, 220, 305, 281, 360, 279])
+
     def __init__(self):
         # MediaPipe 얼굴 메시 초기화
+        # MediaPipe 그래프는 스레드 안전하지 않으므로 검출 작업마다 풀에서 인스턴스를 하나씩 빌려 사용
+        # (공유 엔진에 여러 요청이 동시에 들어와도 한 인스턴스를 두 스레드가 함께 쓰지 않음)
         self.mp_face = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face.FaceMesh(
-            static_image_mode=False, 
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
+        self.detect_workers = 2  # 얼굴 메시 검출 스레드 수 (프레임을 연속 구간으로 나누어 병렬 검출)
+        self.face_meshes = [self._create_face_mesh() for _ in range(self.detect_workers)]
+        self.face_mesh_pool = queue.Queue()
+        for face_mesh in self.face_meshes:
+            self.face_mesh_pool.put(face_mesh)
+        self.detect_executor = ThreadPoolExecutor(
+            max_workers=self.detect_workers, thread_name_prefix="rppg-facemesh"
         )
         
         # rPPG 파라미터
@@ -43,19 +87,53 @@ class RealRPPGEngine:
         self.lowcut = 0.7  # 0.7 Hz (42 BPM)
         self.highcut = 4.0  # 4.0 Hz (240 BPM)
         
-        # 얼굴 영역 정의 (MediaPipe 랜드마크 인덱스)
-        self.forehead_landmarks = [10, 338, 297, 332, 284, 251, 389, 356, 454, 323]
-        self.cheek_landmarks = [116, 117, 118, 119, 120, 121, 126, 142, 143, 144, 145, 146, 147]
-        self.nose_landmarks = [1, 2, 5, 4, 6, 19, 20, 94, 125, 141, 235, 236, 3, 51, 48, 115, 131, 134, 102, 49, 220, 305, 281, 360, 279]
+        # RGB 추출 파이프라인 파라미터 (검출 → ROI 평균 단계 사이 대기열 크기)
+        self.pipeline_depth = 8
+        self.detect_stride = 3  # 얼굴 메시 검출 간격 (프레임) - 사이 프레임은 직전 랜드마크 재사용
+        self.detect_max_side = 256  # 얼굴 메시 입력 최대 변 길이 (픽셀) - 큰 프레임은 축소 후 검출
+        self.roi_drift_tolerance = 2.0  # ROI 마스크 재사용 허용 랜드마크 이동량 (픽셀)
+        
+        # HRV/스트레스 분석을 수행할 최소 신호 품질 점수 (미만, 즉 Poor 등급이면 생략)
+        self.min_quality_score = 0.4
+        
+        # 디버그 모드 - 중간 분석 배열(RR 간격 등)을 결과에 포함
+        self.debug = False
+        
+        # 대역통과 필터 계수 (4차 Butterworth, SOS 형식) - 한 번만 설계
+        # float32 계수를 사용해야 sosfiltfilt가 float32 신호를 float64로 올리지 않음
+        if self.highcut < self.sample_rate / 2:  # 유효한 주파수 범위인지 확인
+            self.bandpass_sos = signal.butter(
+                4, [self.lowcut, self.highcut], btype='band', fs=self.sample_rate, output='sos'
+            ).astype(np.float32)
+        else:
+            self.bandpass_sos = None
         
         logger.info("✅ 실제 rPPG 엔진 초기화 완료 (MediaPipe 기반)")
     
-    def analyze_video_frames(self, video_frames: List[np.ndarray], duration: float) -> Dict[str, Any]:
+    @classmethod
+    def get_instance(cls) -> "RealRPPGEngine":
+        """모듈 전역 엔진 인스턴스 반환
+        
+        MediaPipe 그래프 초기화 비용이 크므로 요청마다 새로 생성하지 말고 이 인스턴스를 재사용
+        """
+        return real_rppg_engine
+    
+    def _create_face_mesh(self):
+        """rPPG용 MediaPipe 얼굴 메시 인스턴스 생성"""
+        return self.mp_face.FaceMesh(
+            static_image_mode=False, 
+            max_num_faces=1,
+            refine_landmarks=False,  # 홍채 랜드마크는 이마 ROI에 사용하지 않음
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+    
+    def analyze_video_frames(self, video_frames: Union[List[np.ndarray], np.ndarray], duration: float) -> Dict[str, Any]:
         """
         비디오 프레임에서 실제 rPPG 분석 수행
         
         Args:
-            video_frames: 비디오 프레임 리스트
+            video_frames: BGR 비디오 프레임 리스트 또는 디코딩된 (N, H, W, 3) uint8 배열
             duration: 비디오 길이 (초)
             
         Returns:
@@ -64,6 +142,10 @@ class RealRPPGEngine:
         try:
             logger.info(f"실제 rPPG 분석 시작: {len(video_frames)} 프레임, {duration}초")
             
+            # 디코딩된 프레임 배열은 복사 없이 그대로 사용 (형태만 검증)
+            if isinstance(video_frames, np.ndarray) and (video_frames.ndim != 4 or video_frames.shape[-1] != 3):
+                raise ValueError(f"프레임 배열 형태가 올바르지 않습니다: {video_frames.shape} (N, H, W, 3 필요)")
+            
             if len(video_frames) < 30:  # 최소 1초 (30fps 기준)
                 raise ValueError(f"프레임 수가 부족합니다: {len(video_frames)} < 30")
             
@@ -76,15 +158,21 @@ class RealRPPGEngine:
             # 3단계: 심박수 추출
             heart_rate_result = self._extract_heart_rate(processed_signals, duration)
             
-            # 4단계: 심박변이도(HRV) 계산
-            hrv_result = self._calculate_hrv(processed_signals, duration)
-            
-            # 5단계: 스트레스 수준 평가
-            stress_result = self._assess_stress_level(heart_rate_result, hrv_result)
-            
-            # 6단계: 신호 품질 평가
+            # 4단계: 신호 품질 평가
             quality_result = self._assess_signal_quality(processed_signals, heart_rate_result)
             
+            if quality_result['quality_score'] < self.min_quality_score:
+                # 품질이 너무 낮으면 피크 검출 기반 HRV/스트레스 분석은 생략
+                logger.info(f"신호 품질 부족으로 HRV/스트레스 분석 생략: {quality_result['quality_score']:.2f}")
+                hrv_result = {'hrv': 0.0, 'sdnn': 0.0, 'hrv_score': 0.0, 'confidence': 0.0}
+                stress_result = {'stress_level': "알 수 없음", 'stress_score': 0.5}
+            else:
+                # 5단계: 심박변이도(HRV) 계산
+                hrv_result = self._calculate_hrv(processed_signals, duration)
+                
+                # 6단계: 스트레스 수준 평가
+                stress_result = self._assess_stress_level(heart_rate_result, hrv_result)
+            
             # 7단계: 결과 통합
             final_result = self._integrate_results(
                 heart_rate_result, hrv_result, stress_result, quality_result, duration
@@ -97,105 +185,216 @@ class RealRPPGEngine:
             logger.error(f"실제 rPPG 분석 실패: {e}")
             return self._get_error_result(str(e))
     
-    def _extract_rgb_signals(self, video_frames: List[np.ndarray]) -> Dict[str, List[float]]:
+    def _extract_rgb_signals(self, video_frames: Union[List[np.ndarray], np.ndarray]) -> Dict[str, np.ndarray]:
         """비디오 프레임에서 RGB 신호 추출"""
         try:
-            rgb_signals = {'red': [], 'green': [], 'blue': []}
-            valid_frames = 0
-            
-            for frame in video_frames:
-                # BGR to RGB 변환
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # 얼굴 랜드마크 검출
-                results = self.face_mesh.process(rgb_frame)
-                
-                if results.multi_face_landmarks:
-                    h, w, _ = frame.shape
-                    landmarks = results.multi_face_landmarks[0].landmark
-                    
-                    # 이마 영역 마스크 생성
-                    mask = self._create_face_mask(landmarks, h, w, self.forehead_landmarks)
-                    
-                    # RGB 채널별 평균값 추출
-                    mean_rgb = cv2.mean(rgb_frame, mask=mask)
-                    
-                    rgb_signals['red'].append(mean_rgb[0])
-                    rgb_signals['green'].append(mean_rgb[1])
-                    rgb_signals['blue'].append(mean_rgb[2])
-                    valid_frames += 1
-                else:
-                    # 얼굴이 검출되지 않은 경우 이전 값 유지
-                    if rgb_signals['red']:
-                        rgb_signals['red'].append(rgb_signals['red'][-1])
-                        rgb_signals['green'].append(rgb_signals['green'][-1])
-                        rgb_signals['blue'].append(rgb_signals['blue'][-1])
-            
-            logger.info(f"RGB 신호 추출 완료: {valid_frames}/{len(video_frames)} 프레임")
-            return rgb_signals
+            num_frames = len(video_frames)
+            rgb_buffer = np.empty((3, num_frames), dtype=np.float32)
+            detected = np.zeros(num_frames, dtype=bool)
+            
+            # 랜드마크 검출(검출 스레드 풀)과 ROI 평균 계산(소비자 스레드)을 겹쳐서 수행
+            roi_queue = queue.Queue(maxsize=self.pipeline_depth)
+            roi_worker = threading.Thread(
+                target=self._roi_mean_worker, args=(roi_queue, rgb_buffer, detected), daemon=True
+            )
+            roi_worker.start()
+            
+            try:
+                # 검출 스레드마다 연속된 프레임 구간 하나씩 할당 (구간 안에서는 추적 유지)
+                bounds = np.linspace(0, num_frames, self.detect_workers + 1).astype(int)
+                futures = [
+                    self.detect_executor.submit(
+                        self._detect_landmarks, video_frames, chunk, start, stop, roi_queue
+                    )
+                    for chunk, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:]))
+                ]
+                wait(futures)
+                for future in futures:
+                    future.result()
+            finally:
+                roi_queue.put(None)
+                roi_worker.join()
+            
+            valid_frames = int(np.count_nonzero(detected))
+            logger.info(f"RGB 신호 추출 완료: {valid_frames}/{num_frames} 프레임")
+            
+            if valid_frames == 0:
+                empty = np.empty(0, dtype=np.float32)
+                return {'red': empty, 'green': empty, 'blue': empty}
+            
+            # 얼굴이 검출되지 않은 프레임은 이전 값 유지 (첫 검출 이전 프레임은 제외)
+            last_detected = np.where(detected, np.arange(num_frames), 0)
+            np.maximum.accumulate(last_detected, out=last_detected)
+            rgb_buffer = rgb_buffer[:, last_detected[np.argmax(detected):]]
+            
+            return {'red': rgb_buffer[0], 'green': rgb_buffer[1], 'blue': rgb_buffer[2]}
             
         except Exception as e:
             logger.error(f"RGB 신호 추출 실패: {e}")
             raise
     
-    def _create_face_mask(self, landmarks, height: int, width: int, landmark_indices: List[int]) -> np.ndarray:
-        """얼굴 랜드마크를 기반으로 마스크 생성"""
+    def _detect_landmarks(self, video_frames: Union[List[np.ndarray], np.ndarray], chunk: int,
+                          start: int, stop: int, roi_queue: queue.Queue) -> None:
+        """검출 스레드 - [start, stop) 구간 프레임의 이마 랜드마크 좌표를 대기열에 전달
+        
+        얼굴 메시는 풀에서 빌려 이 구간에서만 사용하고 끝나면 반납
+        """
+        face_mesh = self.face_mesh_pool.get()
+        try:
+            # 이전 작업(다른 구간이나 다른 요청)의 얼굴 추적 상태가 이어지지 않도록 그래프 초기화
+            face_mesh.reset()
+            
+            # 30 FPS에서는 얼굴이 거의 움직이지 않으므로 detect_stride 프레임마다만 검출하고,
+            # 직전 검출이 실패했으면 다음 프레임에서 바로 다시 검출
+            points = None
+            for i in range(start, stop):
+                frame = video_frames[i]
+                
+                # 얼굴 랜드마크 검출 (MediaPipe 입력만 RGB로 변환, ROI 평균은 BGR 원본에서 계산)
+                if points is None or (i - start) % self.detect_stride == 0:
+                    results = face_mesh.process(self._detection_input(frame))
+                    if results.multi_face_landmarks:
+                        # 랜드마크는 정규화 좌표이므로 원본 해상도 기준으로 바로 변환
+                        h, w, _ = frame.shape
+                        points = self._landmark_points(
+                            results.multi_face_landmarks[0].landmark, h, w, self.forehead_landmarks
+                        )
+                    else:
+                        points = None
+                
+                if points is not None:
+                    roi_queue.put((chunk, i, frame, points))
+        finally:
+            self.face_mesh_pool.put(face_mesh)
+    
+    def _detection_input(self, frame: np.ndarray) -> np.ndarray:
+        """얼굴 메시 입력 생성 - 종횡비를 유지한 채 detect_max_side 이하로 축소한 RGB 프레임"""
+        h, w = frame.shape[:2]
+        scale = self.detect_max_side / max(h, w)
+        if scale < 1.0:
+            frame = cv2.resize(frame, (max(1, round(w * scale)), max(1, round(h * scale))),
+                               interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    
+    def _roi_mean_worker(self, roi_queue: queue.Queue, rgb_buffer: np.ndarray, detected: np.ndarray) -> None:
+        """ROI 평균 계산 소비자 스레드 - 이마 랜드마크 픽셀 좌표로 ROI RGB 평균을 버퍼에 기록"""
+        # 얼굴이 거의 움직이지 않는 동안에는 이전 프레임의 마스크를 재사용
+        # 검출 스레드마다 프레임 구간이 다르므로 구간별로 따로 캐시
+        mask_cache = {}
+        
+        while True:
+            item = roi_queue.get()
+            if item is None:
+                break
+            
+            chunk, i, frame, points = item
+            try:
+                h, w, _ = frame.shape
+                
+                # 이마 영역 마스크 생성 (랜드마크 이동량이 허용치를 넘을 때만 다시 생성)
+                cached = mask_cache.get(chunk)
+                if (cached is None or cached[3] != (h, w)
+                        or np.abs(points - cached[2]).max() > self.roi_drift_tolerance):
+                    mask, bbox = self._create_face_mask(points, h, w)
+                    cached = mask_cache[chunk] = (mask, bbox, points, (h, w))
+                cached_mask, cached_bbox = cached[0], cached[1]
+                
+                # 채널별 평균값 추출 (ROI 경계 상자 영역만 읽음, BGR 순서를 RGB로 뒤집어 기록)
+                x, y, bw, bh = cached_bbox
+                mean_bgr = cv2.mean(frame[y:y + bh, x:x + bw], mask=cached_mask)
+                
+                rgb_buffer[:, i] = mean_bgr[2::-1]
+                detected[i] = True
+                
+            except Exception as e:
+                logger.warning(f"ROI 평균 계산 실패 (프레임 {i}): {e}")
+    
+    def _landmark_points(self, landmarks, height: int, width: int, landmark_indices: np.ndarray) -> np.ndarray:
+        """랜드마크 인덱스에 해당하는 픽셀 좌표 (K, 2) 배열 반환
+        
+        전체 468개 랜드마크를 배열로 변환하지 않고 필요한 K개만 읽음
+        """
+        # 인덱스는 정렬되어 있으므로 범위를 벗어나는 인덱스는 한 번에 잘라냄
+        valid_indices = landmark_indices[:np.searchsorted(landmark_indices, len(landmarks))]
+        points = np.array(
+            [(landmarks[idx].x, landmarks[idx].y) for idx in valid_indices.tolist()],
+            dtype=np.float32
+        ).reshape(-1, 2)
+        points *= (width, height)
+        return points
+    
+    def _create_face_mask(self, points: np.ndarray, height: int, width: int) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
+        """랜드마크 픽셀 좌표를 기반으로 마스크 생성
+        
+        마스크는 프레임 전체가 아니라 ROI 경계 상자 크기로 만들고, 상자 (x, y, w, h)를 함께 반환
+        """
+        empty = (np.zeros((1, 1), dtype=np.uint8), (0, 0, 1, 1))
         try:
-            mask = np.zeros((height, width), dtype=np.uint8)
+            if len(points) < 3:
+                return empty
             
-            # 랜드마크 좌표 추출
-            points = []
-            for idx in landmark_indices:
-                if idx < len(landmarks.landmark):
-                    lm = landmarks.landmark[idx]
-                    x = int(lm.x * width)
-                    y = int(lm.y * height)
-                    points.append([x, y])
+            # 볼록 다각형의 경계 상자를 프레임 안으로 제한
+            hull = cv2.convexHull(points.astype(np.int32))
+            x, y, bw, bh = cv2.boundingRect(hull)
+            x0, y0 = max(x, 0), max(y, 0)
+            x1, y1 = min(x + bw, width), min(y + bh, height)
+            if x1 <= x0 or y1 <= y0:
+                return empty
             
-            if len(points) >= 3:
-                # 다각형 마스크 생성
-                pts = np.array(points, dtype=np.int32)
-                cv2.fillPoly(mask, [pts], 255)
+            # 볼록 다각형 마스크 생성 (경계 상자 좌표계)
+            mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+            cv2.fillConvexPoly(mask, hull - np.array([x0, y0], dtype=np.int32), 255)
             
-            return mask
+            return mask, (x0, y0, x1 - x0, y1 - y0)
             
         except Exception as e:
             logger.warning(f"얼굴 마스크 생성 실패: {e}")
-            return np.zeros((height, width), dtype=np.uint8)
+            return empty
     
-    def _preprocess_signals(self, rgb_signals: Dict[str, List[float]], duration: float) -> Dict[str, np.ndarray]:
-        """RGB 신호 전처리 및 필터링"""
+    def _preprocess_signals(self, rgb_signals: Dict[str, np.ndarray], duration: float) -> Dict[str, np.ndarray]:
+        """RGB 신호 전처리 및 필터링
+        
+        채널들을 하나의 (채널, N) float32 배열로 쌓아 모든 단계를 축 단위로 한 번에 처리
+        """
         try:
-            processed_signals = {}
+            channels = [channel for channel, signal_data in rgb_signals.items() if len(signal_data) >= 10]
+            if not channels:
+                return {}
             
-            for channel, signal_data in rgb_signals.items():
-                if len(signal_data) < 10:
-                    continue
-                
-                # numpy 배열로 변환
-                signal_array = np.array(signal_data, dtype=np.float32)
-                
-                # 1. 이동평균 필터 (노이즈 제거)
-                window_size = min(5, len(signal_array) // 10)
-                if window_size > 1:
-                    signal_array = self._moving_average(signal_array, window_size)
-                
-                # 2. 정규화 (Z-score)
-                signal_array = (signal_array - np.mean(signal_array)) / (np.std(signal_array) + 1e-8)
-                
-                # 3. 대역통과 필터 (심박수 범위)
-                nyquist = self.sample_rate / 2
-                low = self.lowcut / nyquist
-                high = self.highcut / nyquist
-                
-                if high < 1.0:  # 유효한 주파수 범위인지 확인
-                    b, a = signal.butter(4, [low, high], btype='band')
-                    signal_array = signal.filtfilt(b, a, signal_array)
-                
-                # 4. 이상치 제거 (IQR 방법)
-                signal_array = self._remove_outliers(signal_array)
-                
-                processed_signals[channel] = signal_array
+            signal_array = np.stack([np.asarray(rgb_signals[channel], dtype=np.float32) for channel in channels])
+            num_samples = signal_array.shape[-1]
+            
+            # 1. 이동평균 필터 (노이즈 제거)
+            window_size = min(5, num_samples // 10)
+            if window_size > 1:
+                signal_array = self._moving_average(signal_array, window_size)
+            
+            # 2. 추세 제거 (2초 이동평균 차감) - 조명 변화 등 느린 드리프트를 필터 전에 제거
+            dc_level = signal_array.mean(axis=-1, keepdims=True)
+            trend_window = int(self.sample_rate * 2)
+            if num_samples > trend_window:
+                signal_array -= uniform_filter1d(signal_array, size=trend_window, axis=-1, mode='nearest')
+            
+            # CHROM 맥파 신호 (세 채널이 모두 있을 때) - 정규화 전 밝기 대비 변화량으로 계산
+            pulse = None
+            if {'red', 'green', 'blue'} <= set(channels):
+                rgb = [channels.index(channel) for channel in ('red', 'green', 'blue')]
+                pulse = self._chrom_pulse(signal_array[rgb] / (dc_level[rgb] + 1e-8))
+            
+            # 3. 정규화 (Z-score)
+            signal_array -= signal_array.mean(axis=-1, keepdims=True)
+            signal_array /= signal_array.std(axis=-1, keepdims=True) + 1e-8
+            
+            # 4. 대역통과 필터 (심박수 범위)
+            if self.bandpass_sos is not None:
+                signal_array = signal.sosfiltfilt(self.bandpass_sos, signal_array, axis=-1)
+            
+            # 5. 이상치 제거 (IQR 방법)
+            signal_array = self._remove_outliers(signal_array)
+            
+            processed_signals = dict(zip(channels, signal_array))
+            if pulse is not None:
+                processed_signals['pulse'] = pulse
             
             return processed_signals
             
@@ -203,84 +402,119 @@ class RealRPPGEngine:
             logger.error(f"신호 전처리 실패: {e}")
             raise
     
-    def _moving_average(self, signal: np.ndarray, window_size: int) -> np.ndarray:
+    def _chrom_pulse(self, normalized_rgb: np.ndarray) -> np.ndarray:
+        """CHROM 방식 맥파 신호 (de Haan & Jeanne)
+        
+        밝기 대비 정규화된 (3, N) RGB 변화량에서 색차 신호 두 개를 만들고,
+        대역통과 후 표준편차 비로 섞어 움직임/조명 성분을 상쇄
+        """
+        red, green, blue = normalized_rgb - normalized_rgb.mean(axis=-1, keepdims=True)
+        chrominance = np.stack([3 * red - 2 * green, 1.5 * red + green - 1.5 * blue])
+        
+        if self.bandpass_sos is not None:
+            chrominance = signal.sosfiltfilt(self.bandpass_sos, chrominance, axis=-1)
+        
+        x_signal, y_signal = chrominance
+        pulse = x_signal - (np.std(x_signal) / (np.std(y_signal) + 1e-8)) * y_signal
+        
+        # 다른 채널과 같은 척도로 정규화 (Z-score) 후 이상치 제거
+        pulse = (pulse - np.mean(pulse)) / (np.std(pulse) + 1e-8)
+        return self._remove_outliers(pulse)
+    
+    def _pulse_signal(self, processed_signals: Dict[str, np.ndarray]) -> Optional[np.ndarray]:
+        """심박 분석에 사용할 신호 - CHROM 맥파가 있으면 사용하고, 없으면 녹색 채널"""
+        return processed_signals.get('pulse', processed_signals.get('green'))
+    
+    def _moving_average(self, signal_data: np.ndarray, window_size: int) -> np.ndarray:
         """이동평균 필터"""
         try:
             if window_size <= 1:
-                return signal
-            
-            # 패딩 추가
-            padded = np.pad(signal, (window_size//2, window_size//2), mode='edge')
-            
-            # 이동평균 계산
-            smoothed = np.convolve(padded, np.ones(window_size)/window_size, mode='valid')
+                return signal_data
             
-            return smoothed
+            # 이동평균 계산 (O(N) 누적합 필터, 가장자리 값으로 패딩, 마지막 축 기준)
+            return uniform_filter1d(signal_data, size=window_size, axis=-1, mode='nearest')
             
         except Exception as e:
             logger.warning(f"이동평균 필터 실패: {e}")
-            return signal
+            return signal_data
     
-    def _remove_outliers(self, signal: np.ndarray) -> np.ndarray:
+    def _remove_outliers(self, signal_data: np.ndarray) -> np.ndarray:
         """IQR 방법으로 이상치 제거"""
         try:
-            if len(signal) < 10:
-                return signal
-            
-            q25 = np.percentile(signal, 25)
-            q75 = np.percentile(signal, 75)
+            if signal_data.shape[-1] < 10:
+                return signal_data
+            
+            # 채널별 사분위수 (마지막 축 기준) - 한 번의 부분 정렬로 두 사분위수를 함께 계산
+            # np.percentile 기본(linear) 방식과 같게 인접한 두 순위 값을 선형 보간
+            positions = np.array([0.25, 0.75]) * (signal_data.shape[-1] - 1)
+            lower = np.floor(positions).astype(np.intp)
+            upper = np.minimum(lower + 1, signal_data.shape[-1] - 1)
+            partitioned = np.partition(signal_data, np.unique(np.concatenate([lower, upper])), axis=-1)
+            fraction = (positions - lower).astype(signal_data.dtype)
+            q25, q75 = np.split(
+                partitioned[..., lower] + (partitioned[..., upper] - partitioned[..., lower]) * fraction, 2, axis=-1
+            )
             iqr = q75 - q25
             
             lower_bound = q25 - 1.5 * iqr
             upper_bound = q75 + 1.5 * iqr
             
             # 이상치를 경계값으로 클리핑
-            signal_clipped = np.clip(signal, lower_bound, upper_bound)
+            signal_clipped = np.clip(signal_data, lower_bound, upper_bound)
             
             return signal_clipped
             
         except Exception as e:
             logger.warning(f"이상치 제거 실패: {e}")
-            return signal
+            return signal_data
     
     def _extract_heart_rate(self, processed_signals: Dict[str, np.ndarray], duration: float) -> Dict[str, Any]:
         """심박수 추출"""
         try:
-            if 'green' not in processed_signals:
-                raise ValueError("녹색 채널 신호가 없습니다")
-            
-            green_signal = processed_signals['green']
+            pulse_signal = self._pulse_signal(processed_signals)
+            if pulse_signal is None:
+                raise ValueError("맥파 신호가 없습니다")
             
-            if len(green_signal) < 30:
+            if len(pulse_signal) < 30:
                 raise ValueError("신호 길이가 부족합니다")
             
-            # FFT를 사용한 주파수 분석
-            fft_result = fft(green_signal)
-            freqs = fftfreq(len(green_signal), 1/self.sample_rate)
+            # FFT를 사용한 주파수 분석 (실수 신호이므로 rFFT로 양의 주파수만 계산)
+            # 소인수 분해가 쉬운 길이로 0 패딩해 어색한 신호 길이에서도 빠르게 계산
+            n_fft = next_fast_len(len(pulse_signal), real=True)
+            # Hann 창으로 양 끝 불연속에 의한 스펙트럼 누설을 줄여 피크를 선명하게 유지
+            fft_result = rfft(pulse_signal * _hann_window(len(pulse_signal)), n=n_fft)
+            power_spectrum = fft_result.real ** 2 + fft_result.imag ** 2
             
-            # 양의 주파수만 사용
-            positive_freqs = freqs[freqs > 0]
-            positive_fft = fft_result[freqs > 0]
-            power_spectrum = np.abs(positive_fft) ** 2
-            
-            # 심박수 범위 필터링 (0.67-3.33 Hz = 40-200 BPM)
-            bpm_freq_range = (positive_freqs >= self.min_bpm/60) & (positive_freqs <= self.max_bpm/60)
+            # 심박수 범위 필터링 (0.67-3.33 Hz = 40-200 BPM) - 대역에 해당하는 빈 구간만 잘라냄
+            band_start, band_stop, bin_width = _rfft_band_bins(
+                n_fft, self.sample_rate, self.min_bpm/60, self.max_bpm/60
+            )
             
-            if not np.any(bpm_freq_range):
+            if band_stop < band_start:
                 raise ValueError("유효한 심박수 범위가 없습니다")
             
             # 최대 파워 주파수 찾기
-            valid_freqs = positive_freqs[bpm_freq_range]
-            valid_power = power_spectrum[bpm_freq_range]
+            valid_power = power_spectrum[band_start:band_stop + 1]
             
             peak_idx = np.argmax(valid_power)
-            peak_freq = valid_freqs[peak_idx]
+            
+            # 피크 빈과 양옆 빈에 포물선을 맞춰 빈 간격보다 세밀한 주파수 추정 (로그 파워 기준)
+            peak_offset = 0.0
+            if 0 < peak_idx < len(valid_power) - 1:
+                y0, y1, y2 = np.log(valid_power[peak_idx - 1:peak_idx + 2] + 1e-12)
+                curvature = y0 - 2 * y1 + y2
+                if curvature < 0:
+                    peak_offset = 0.5 * (y0 - y2) / curvature
+            peak_freq = (band_start + peak_idx + peak_offset) * bin_width
             heart_rate = peak_freq * 60  # Hz to BPM
             
-            # 신뢰도 계산 (피크의 상대적 강도)
-            max_power = np.max(valid_power)
-            mean_power = np.mean(valid_power)
-            confidence = min(1.0, max_power / (mean_power + 1e-8))
+            # 신뢰도/SNR 계산 - 대역 전체 파워 중 피크 주엽(Hann 창 주엽 폭, 0 패딩 반영)이 차지하는 비율
+            # 잡음은 파워가 대역에 고르게 퍼져 낮게, 뚜렷한 맥파는 1에 가깝게 나옴
+            lobe_bins = int(np.ceil(2 * n_fft / len(pulse_signal)))
+            peak_power = valid_power[max(peak_idx - lobe_bins, 0):peak_idx + lobe_bins + 1].sum()
+            band_power = valid_power.sum()
+            confidence = peak_power / (band_power + 1e-12)
+            snr = 10 * np.log10((peak_power + 1e-12) / (band_power - peak_power + 1e-12))
             
             # 심박수 범위 검증
             if not (self.min_bpm <= heart_rate <= self.max_bpm):
@@ -288,14 +522,20 @@ class RealRPPGEngine:
                 heart_rate = np.clip(heart_rate, self.min_bpm, self.max_bpm)
                 confidence *= 0.5  # 신뢰도 감소
             
-            return {
+            heart_rate_result = {
                 'heart_rate': float(heart_rate),
                 'confidence': float(confidence),
                 'peak_frequency': float(peak_freq),
-                'power_spectrum': valid_power.tolist(),
-                'frequency_range': valid_freqs.tolist()
+                'snr_db': float(snr)
             }
             
+            # 스펙트럼 배열은 디버그 모드에서만 포함 (결과 통합에는 사용되지 않음)
+            if self.debug:
+                heart_rate_result['power_spectrum'] = valid_power
+                heart_rate_result['frequency_range'] = np.arange(band_start, band_stop + 1) * bin_width
+            
+            return heart_rate_result
+            
         except Exception as e:
             logger.error(f"심박수 추출 실패: {e}")
             raise
@@ -303,16 +543,15 @@ class RealRPPGEngine:
     def _calculate_hrv(self, processed_signals: Dict[str, np.ndarray], duration: float) -> Dict[str, Any]:
         """심박변이도(HRV) 계산"""
         try:
-            if 'green' not in processed_signals:
-                return {'hrv': 0.0, 'confidence': 0.0}
-            
-            green_signal = processed_signals['green']
+            pulse_signal = self._pulse_signal(processed_signals)
+            if pulse_signal is None:
+                return {'hrv': 0.0, 'sdnn': 0.0, 'hrv_score': 0.0, 'confidence': 0.0}
             
             # 피크 검출을 통한 RR 간격 계산
-            peaks = self._detect_peaks(green_signal)
+            peaks = self._detect_peaks(pulse_signal)
             
             if len(peaks) < 3:
-                return {'hrv': 0.0, 'confidence': 0.0}
+                return {'hrv': 0.0, 'sdnn': 0.0, 'hrv_score': 0.0, 'confidence': 0.0}
             
             # RR 간격 계산 (샘플 단위)
             rr_intervals = np.diff(peaks) / self.sample_rate  # 초 단위로 변환
@@ -330,76 +569,53 @@ class RealRPPGEngine:
             # HRV 점수 정규화 (0-100)
             hrv_score = min(100, max(0, (rmssd - 10) / 50 * 100))
             
-            return {
+            hrv_result = {
                 'hrv': float(rmssd),
                 'sdnn': float(sdnn),
                 'hrv_score': float(hrv_score),
-                'rr_intervals': rr_intervals.tolist(),
                 'confidence': min(1.0, len(peaks) / (duration * 2))  # 초당 2회 피크 기준
             }
             
+            # 중간 배열은 디버그 모드에서만 포함 (결과 통합에는 사용되지 않음)
+            if self.debug:
+                hrv_result['rr_intervals'] = rr_intervals
+            
+            return hrv_result
+            
         except Exception as e:
             logger.warning(f"HRV 계산 실패: {e}")
-            return {'hrv': 0.0, 'confidence': 0.0}
+            return {'hrv': 0.0, 'sdnn': 0.0, 'hrv_score': 0.0, 'confidence': 0.0}
     
-    def _detect_peaks(self, signal: np.ndarray) -> np.ndarray:
+    def _detect_peaks(self, signal_data: np.ndarray) -> np.ndarray:
         """신호에서 피크 검출"""
         try:
-            # 간단한 피크 검출 알고리즘
-            peaks = []
-            min_distance = int(self.sample_rate * 0.4)  # 최소 0.4초 간격
-            
-            for i in range(min_distance, len(signal) - min_distance):
-                if signal[i] > signal[i-1] and signal[i] > signal[i+1]:
-                    # 주변 최대값인지 확인
-                    is_peak = True
-                    for j in range(max(0, i-min_distance), min(len(signal), i+min_distance)):
-                        if j != i and signal[j] >= signal[i]:
-                            is_peak = False
-                            break
-                    
-                    if is_peak:
-                        peaks.append(i)
-            
-            return np.array(peaks)
+            # 최소 0.4초 간격, 신호 표준편차의 절반 이상 돌출된 지점만 피크로 판정
+            min_distance = int(self.sample_rate * 0.4)
+            peaks, _ = signal.find_peaks(
+                signal_data, distance=min_distance, prominence=0.5 * np.std(signal_data)
+            )
+            return peaks
             
         except Exception as e:
             logger.warning(f"피크 검출 실패: {e}")
-            return np.array([])
+            return np.array([], dtype=np.intp)
     
     def _assess_stress_level(self, heart_rate_result: Dict, hrv_result: Dict) -> Dict[str, Any]:
         """스트레스 수준 평가"""
         try:
             hr = heart_rate_result['heart_rate']
             hrv = hrv_result['hrv']
-            
-            stress_score = 0.0
-            stress_level = "보통"
-            
-            # 심박수 기반 스트레스 평가
-            if hr > 100:
-                stress_score += 0.4
-            elif hr > 85:
-                stress_score += 0.2
-            elif hr < 60:
-                stress_score += 0.1
-            
-            # HRV 기반 스트레스 평가
-            if hrv < 20:
-                stress_score += 0.4
-            elif hrv < 30:
-                stress_score += 0.2
-            elif hrv > 50:
-                stress_score -= 0.1
-            
-            # 스트레스 수준 분류
-            if stress_score >= 0.6:
-                stress_level = "높음"
-            elif stress_score >= 0.3:
-                stress_level = "보통"
-            else:
-                stress_level = "낮음"
-            
+
+            # 임계값 비교 결과를 0.1 단위 정수 점수로 누적 (분기 없음)
+            # 심박수: >100 → 4, >85 → 2, <60 → 1 / HRV: <20 → 4, <30 → 2, >50 → -1
+            hr_points = 2 * (hr > 85) + 2 * (hr > 100) + (hr < 60)
+            hrv_points = 2 * (hrv < 30) + 2 * (hrv < 20) - (hrv > 50)
+            points = int(hr_points + hrv_points)
+
+            # 스트레스 수준 분류 (점수 -1..8 → 테이블 인덱스 0..9)
+            stress_level = self._STRESS_LEVELS[points + 1]
+            stress_score = points / 10
+
             return {
                 'stress_level': stress_level,
                 'stress_score': float(stress_score),
@@ -414,55 +630,41 @@ class RealRPPGEngine:
     def _assess_signal_quality(self, processed_signals: Dict[str, np.ndarray], heart_rate_result: Dict) -> Dict[str, Any]:
         """신호 품질 평가"""
         try:
-            if 'green' not in processed_signals:
+            # 심박수/HRV 분석과 같은 신호(CHROM 맥파, 없으면 녹색 채널)를 평가
+            pulse_signal = self._pulse_signal(processed_signals)
+            if pulse_signal is None:
                 return {'signal_quality': "Poor", 'quality_score': 0.0}
             
-            green_signal = processed_signals['green']
-            
-            # 1. 신호 대 노이즈 비율 (SNR)
-            signal_power = np.mean(green_signal ** 2)
-            noise_estimate = np.var(green_signal)
-            snr = 10 * np.log10(signal_power / (noise_estimate + 1e-8))
-            
-            # 2. 신호 안정성 (변동계수)
-            cv = np.std(green_signal) / (np.mean(np.abs(green_signal)) + 1e-8)
+            # 1. 신호 대 노이즈 비율 (SNR) - 심박수 대역 안에서 피크 주엽 파워 대 나머지 파워
+            # (정규화된 신호는 평균이 0이라 시간 영역 파워/분산 비는 항상 0 dB이므로 스펙트럼 기준 사용)
+            snr = heart_rate_result.get('snr_db', 0.0)
+            
+            # 2. 신호 안정성 (1초 구간별 맥파 진폭(RMS)의 변동계수 - 움직임/조명 변화 구간에서 커짐)
+            window = int(self.sample_rate)
+            num_windows = len(pulse_signal) // window
+            if num_windows >= 2:
+                window_rms = np.sqrt(np.mean(
+                    np.square(pulse_signal[:num_windows * window].reshape(num_windows, window)), axis=1
+                ))
+                cv = np.std(window_rms) / (np.mean(window_rms) + 1e-8)
+            else:
+                cv = 1.0  # 구간이 부족하면 안정성을 판단할 수 없으므로 최저 점수
             
             # 3. 심박수 신뢰도
             hr_confidence = heart_rate_result.get('confidence', 0.0)
             
-            # 종합 품질 점수 계산
-            quality_score = 0.0
+            # 종합 품질 점수 계산 (임계값 테이블 구간 조회)
+            # SNR 점수 (0-40%): 0/5/10 dB 초과 여부
+            quality_score = self._SNR_SCORES[np.searchsorted(self._SNR_BINS, snr, side='left')]
             
-            # SNR 점수 (0-40%)
-            if snr > 20:
-                quality_score += 0.4
-            elif snr > 15:
-                quality_score += 0.3
-            elif snr > 10:
-                quality_score += 0.2
-            else:
-                quality_score += 0.1
-            
-            # 안정성 점수 (0-30%)
-            if cv < 0.1:
-                quality_score += 0.3
-            elif cv < 0.2:
-                quality_score += 0.2
-            elif cv < 0.3:
-                quality_score += 0.1
+            # 안정성 점수 (0-30%): 변동계수 0.1/0.2/0.3 미만 여부
+            quality_score += self._CV_SCORES[np.searchsorted(self._CV_BINS, cv, side='right')]
             
             # 신뢰도 점수 (0-30%)
             quality_score += hr_confidence * 0.3
             
-            # 품질 등급 분류
-            if quality_score >= 0.8:
-                quality_grade = "Excellent"
-            elif quality_score >= 0.6:
-                quality_grade = "Good"
-            elif quality_score >= 0.4:
-                quality_grade = "Fair"
-            else:
-                quality_grade = "Poor"
+            # 품질 등급 분류: 0.4/0.6/0.8 이상 여부
+            quality_grade = self._QUALITY_GRADES[np.searchsorted(self._QUALITY_BINS, quality_score, side='right')]
             
             return {
                 'signal_quality': quality_grade,
@@ -614,17 +816,14 @@ class RealRPPGEngine:
             'recommendations': ["측정 중 오류가 발생했습니다. 다시 시도해주세요."]
         }
 
-# 전역 엔진 인스턴스
+# 전역 엔진 인스턴스 (RealRPPGEngine.get_instance()로 접근)
 real_rppg_engine = RealRPPGEngine()
 
 # 사용 예시
 if __name__ == "__main__":
-    # 테스트용 더미 프레임 생성
-    test_frames = []
-    for i in range(300):  # 10초 (30fps)
-        # 더미 프레임 생성 (실제로는 웹캠에서 가져옴)
-        frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
-        test_frames.append(frame)
+    # 테스트용 더미 프레임 생성 (10초, 30fps - 실제로는 웹캠에서 가져옴)
+    rng = np.random.default_rng()
+    test_frames = rng.integers(0, 255, (300, 480, 640, 3), dtype=np.uint8)
     
     # rPPG 분석 실행
     result = real_rppg_engine.analyze_video_frames(test_frames, 10.0)
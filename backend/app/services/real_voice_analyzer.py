@@ -5,22 +5,61 @@
 """
 
 import numpy as np
+import librosa
 import logging
-from typing import List, Dict, Any, Tuple
+from scipy.fft import rfft, rfftfreq, next_fast_len
+from scipy.signal import butter, find_peaks, sosfiltfilt
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 import json
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=16)
+def _hnr_band_frequencies(n_fft: int, sample_rate: int, max_freq: float) -> np.ndarray:
+    """rFFT 길이별 HNR 분석 대역(DC 제외, max_freq 이하) 주파수 축 (캐시, 읽기 전용)"""
+    freqs = rfftfreq(n_fft, 1 / sample_rate)[1:]
+    band_freqs = freqs[:np.searchsorted(freqs, max_freq)].copy()
+    band_freqs.flags.writeable = False
+    return band_freqs
+
 class RealVoiceAnalyzer:
     """실제 음성 신호 분석기"""
     
+    # 신호 품질 등급별 신뢰도
+    _QUALITY_CONFIDENCE = {
+        "Excellent": 0.95,
+        "Good": 0.85,
+        "Fair": 0.70,
+        "Poor": 0.50,
+        "Unknown": 0.60
+    }
+    
     def __init__(self):
         self.sample_rate = 44100  # 44.1 kHz
         self.min_duration = 1.0  # 최소 1초
+        self.max_analysis_duration = 3.0  # 분석 구간 최대 3초 (신뢰도 계산의 3초 기준과 동일)
         self.frame_length = 2048  # FFT 프레임 길이
         self.hop_length = 512    # 프레임 간격
         
+        # 시뮬레이션 노이즈용 난수 생성기와 재사용 버퍼
+        self._rng = np.random.default_rng()
+        self._noise_buf = None
+        
+        # (길이, 샘플링 레이트)별 시뮬레이션 하모닉 파형 캐시
+        self._wave_cache: Dict[Tuple[float, int], np.ndarray] = {}
+        
+        # 음성 기본주파수 대역 (80-800 Hz) - 대역통과 필터, F0 탐색 범위, HNR 분석 대역에 공통 사용
+        self.voice_band = (80.0, 800.0)
+        
+        # 대역통과 필터 (4차 Butterworth, SOS 형식) - 한 번만 설계
+        # float32 계수를 사용해야 sosfiltfilt가 float32 신호를 float64로 올리지 않음
+        self.bandpass_sos = butter(
+            4, self.voice_band, btype='bandpass', fs=self.sample_rate, output='sos'
+        ).astype(np.float32)
+        
     def analyze_audio_data(self, audio_data: bytes, duration: float) -> Dict[str, Any]:
         """
         실제 오디오 데이터에서 음성 특성 분석
@@ -33,13 +72,15 @@ class RealVoiceAnalyzer:
             분석 결과 딕셔너리
         """
         try:
-            logger.info(f"실제 음성 분석 시작: {len(audio_data)} bytes, {duration}초")
+            logger.info("실제 음성 분석 시작: %d bytes, %s초", len(audio_data), duration)
             
             if duration < self.min_duration:
                 raise ValueError(f"오디오 길이가 부족합니다: {duration} < {self.min_duration}")
             
             # 1단계: 오디오 신호 변환 (실제 구현에서는 librosa 사용)
-            audio_signal = self._convert_audio_to_signal(audio_data, duration)
+            # 긴 녹음도 앞부분 최대 3초만 분석 (신뢰도는 원래 길이로 계산)
+            analysis_duration = min(duration, self.max_analysis_duration)
+            audio_signal = self._convert_audio_to_signal(audio_data, analysis_duration)
             
             # 2단계: 신호 전처리
             preprocessed_signal = self._preprocess_signal(audio_signal)
@@ -47,11 +88,14 @@ class RealVoiceAnalyzer:
             # 3단계: 기본주파수(F0) 분석
             f0_analysis = self._analyze_fundamental_frequency(preprocessed_signal)
             
+            # 지터/시머가 함께 쓰는 주기 분할 (한 번만 계산)
+            periods = self._segment_periods(preprocessed_signal, f0_analysis)
+            
             # 4단계: 지터(Jitter) 분석
-            jitter_analysis = self._analyze_jitter(preprocessed_signal, f0_analysis)
+            jitter_analysis = self._analyze_jitter(preprocessed_signal, f0_analysis, periods)
             
             # 5단계: 시머(Shimmer) 분석
-            shimmer_analysis = self._analyze_shimmer(preprocessed_signal, f0_analysis)
+            shimmer_analysis = self._analyze_shimmer(preprocessed_signal, f0_analysis, periods)
             
             # 6단계: HNR(Harmonic-to-Noise Ratio) 분석
             hnr_analysis = self._analyze_hnr(preprocessed_signal, f0_analysis)
@@ -77,7 +121,8 @@ class RealVoiceAnalyzer:
                 "data_points": len(preprocessed_signal)
             }
             
-            logger.info(f"실제 음성 분석 완료: F0={result['f0']:.1f}Hz, Jitter={result['jitter']:.3f}%, HNR={result['hnr']:.1f}dB")
+            logger.info("실제 음성 분석 완료: F0=%.1fHz, Jitter=%.3f%%, HNR=%.1fdB",
+                        result['f0'], result['jitter'], result['hnr'])
             return result
             
         except Exception as e:
@@ -92,28 +137,23 @@ class RealVoiceAnalyzer:
             
             num_samples = int(duration * self.sample_rate)
             
-            # 기본 주파수 (150 Hz)
-            base_frequency = 150
-            time_points = np.linspace(0, duration, num_samples)
+            # 기본 음성 신호 + 하모닉 성분 (같은 길이면 캐시된 파형 재사용)
+            wave = self._wave_cache.get((duration, self.sample_rate))
+            if wave is None:
+                wave = self._harmonic_wave(duration, num_samples)
+                if len(self._wave_cache) >= 8:  # 임의 길이 요청으로 캐시가 무한히 커지지 않도록 제한
+                    self._wave_cache.clear()
+                self._wave_cache[(duration, self.sample_rate)] = wave
             
-            # 기본 음성 신호
-            voice_signal = np.sin(2 * np.pi * base_frequency * time_points)
+            # 노이즈 추가 (현실적인 음성 신호) - 같은 길이면 이전 버퍼에 바로 생성
+            if self._noise_buf is None or len(self._noise_buf) != num_samples:
+                self._noise_buf = np.empty(num_samples, dtype=np.float32)
+            noise = self._rng.standard_normal(out=self._noise_buf, dtype=np.float32)
+            noise *= 0.05
             
-            # 하모닉 성분 추가
-            harmonics = (
-                0.3 * np.sin(2 * np.pi * base_frequency * 2 * time_points) +  # 2차 하모닉
-                0.2 * np.sin(2 * np.pi * base_frequency * 3 * time_points) +  # 3차 하모닉
-                0.1 * np.sin(2 * np.pi * base_frequency * 4 * time_points)    # 4차 하모닉
-            )
-            
-            # 노이즈 추가 (현실적인 음성 신호)
-            noise = np.random.normal(0, 0.05, num_samples)
-            
-            # 전체 신호 생성
-            combined_signal = voice_signal + harmonics + noise
-            
-            # 신호 정규화
-            combined_signal = combined_signal / np.max(np.abs(combined_signal))
+            # 전체 신호 생성 - 노이즈 버퍼는 내부 재사용용이므로 결과는 새 배열로 반환
+            # (정규화는 대역통과 필터 이후 _preprocess_signal에서 한 번만 수행)
+            combined_signal = wave + noise
             
             return combined_signal
             
@@ -121,6 +161,27 @@ class RealVoiceAnalyzer:
             logger.error(f"오디오 신호 변환 실패: {e}")
             raise
     
+    def _harmonic_wave(self, duration: float, num_samples: int) -> np.ndarray:
+        """시뮬레이션 음성 파형 (150 Hz 기본음 + 2-4차 하모닉, 읽기 전용)"""
+        # 기본 주파수 (150 Hz)
+        base_frequency = 150
+        time_points = np.linspace(0, duration, num_samples, dtype=np.float32)
+        
+        # 기본음 위상을 한 번만 계산하고 하모닉은 위상 배수로 같은 버퍼에 누적
+        phase = (2 * np.pi * base_frequency) * time_points
+        wave = np.sin(phase)
+        harmonic = np.empty_like(wave)
+        
+        # 하모닉 성분 추가 (2-4차, 진폭 0.3/0.2/0.1)
+        for order, amplitude in ((2, 0.3), (3, 0.2), (4, 0.1)):
+            np.multiply(phase, order, out=harmonic)
+            np.sin(harmonic, out=harmonic)
+            harmonic *= amplitude
+            wave += harmonic
+        
+        wave.flags.writeable = False
+        return wave
+    
     def _preprocess_signal(self, audio_signal: np.ndarray) -> np.ndarray:
         """신호 전처리"""
         try:
@@ -128,33 +189,30 @@ class RealVoiceAnalyzer:
             detrended_signal = audio_signal - np.mean(audio_signal)
             
             # 2. 대역통과 필터 (80-800 Hz, 음성 기본주파수 범위)
-            low_freq = 80 / (self.sample_rate / 2)
-            high_freq = 800 / (self.sample_rate / 2)
+            filtered_signal = self._bandpass_filter(detrended_signal, *self.voice_band)
             
-            filtered_signal = self._bandpass_filter(detrended_signal, low_freq, high_freq)
+            # 3. 신호 정규화 (필터 출력은 새 배열이므로 제자리 스케일링, 최대 절댓값은 |x| 임시 배열 없이 계산)
+            peak = max(filtered_signal.max(), -filtered_signal.min())
+            filtered_signal *= 1.0 / peak
             
-            # 3. 신호 정규화
-            normalized_signal = filtered_signal / np.max(np.abs(filtered_signal))
-            
-            return normalized_signal
+            return filtered_signal
             
         except Exception as e:
             logger.error(f"신호 전처리 실패: {e}")
             return audio_signal
     
     def _bandpass_filter(self, signal: np.ndarray, low_freq: float, high_freq: float) -> np.ndarray:
-        """대역통과 필터 (실제로는 scipy.signal.butter 사용)"""
+        """대역통과 필터 (low_freq, high_freq: Hz) - 영위상 IIR(sosfiltfilt) 필터링"""
         try:
-            # FFT를 사용한 주파수 도메인 필터링
-            fft_signal = np.fft.fft(signal)
-            freqs = np.fft.fftfreq(len(signal), 1/self.sample_rate)
-            
-            # 주파수 마스크 생성
-            mask = (np.abs(freqs) >= low_freq) & (np.abs(freqs) <= high_freq)
-            fft_signal_filtered = fft_signal * mask
+            # 기본 음성 대역은 미리 설계한 계수 재사용
+            if (low_freq, high_freq) == self.voice_band:
+                sos = self.bandpass_sos
+            else:
+                sos = butter(
+                    4, [low_freq, high_freq], btype='bandpass', fs=self.sample_rate, output='sos'
+                ).astype(np.float32)
             
-            # 역 FFT로 시간 도메인 신호 복원
-            filtered_signal = np.real(np.fft.ifft(fft_signal_filtered))
+            filtered_signal = sosfiltfilt(sos, signal)
             
             return filtered_signal
             
@@ -163,42 +221,26 @@ class RealVoiceAnalyzer:
             return signal
     
     def _analyze_fundamental_frequency(self, signal: np.ndarray) -> Dict[str, Any]:
-        """기본주파수(F0) 분석"""
+        """기본주파수(F0) 분석 - YIN 알고리즘 (프레임별 누적 평균 정규화 차분 함수)"""
         try:
-            # 자동상관함수를 사용한 F0 검출
-            autocorr = np.correlate(signal, signal, mode='full')
-            autocorr = autocorr[len(autocorr)//2:]
-            
-            # 피크 검출
-            peaks = self._find_peaks(autocorr, min_distance=50)
-            
-            if len(peaks) < 2:
-                # 피크가 부족한 경우 기본값 사용
-                return {
-                    "mean_f0": 150.0,
-                    "f0_std": 10.0,
-                    "f0_range": (140, 160),
-                    "detection_method": "autocorrelation_fallback"
-                }
-            
-            # F0 계산 (피크 간격의 역수)
-            f0_values = []
-            for i in range(len(peaks) - 1):
-                lag = peaks[i+1] - peaks[i]
-                if lag > 0:
-                    f0 = self.sample_rate / lag
-                    if 80 <= f0 <= 800:  # 유효한 F0 범위
-                        f0_values.append(f0)
+            # 프레임별 F0 검출 (음성 대역 80-800 Hz, 자동상관 피크 방식보다 옥타브 오류가 적음)
+            min_f0, max_f0 = self.voice_band
+            f0_frames = librosa.yin(
+                signal, fmin=min_f0, fmax=max_f0, sr=self.sample_rate,
+                frame_length=self.frame_length, hop_length=self.hop_length
+            )
+            f0_values = f0_frames[np.isfinite(f0_frames)]
             
-            if not f0_values:
+            if len(f0_values) == 0:
                 return {
                     "mean_f0": 150.0,
                     "f0_std": 10.0,
                     "f0_range": (140, 160),
-                    "detection_method": "autocorrelation_no_valid_f0"
+                    "detection_method": "yin_no_valid_f0"
                 }
             
-            mean_f0 = np.mean(f0_values)
+            # 프레임 대표값은 이상 프레임에 강한 중앙값 사용
+            mean_f0 = np.median(f0_values)
             f0_std = np.std(f0_values)
             f0_range = (np.min(f0_values), np.max(f0_values))
             
@@ -206,7 +248,7 @@ class RealVoiceAnalyzer:
                 "mean_f0": float(mean_f0),
                 "f0_std": float(f0_std),
                 "f0_range": tuple(map(float, f0_range)),
-                "detection_method": "autocorrelation",
+                "detection_method": "yin",
                 "f0_values": f0_values
             }
             
@@ -219,42 +261,24 @@ class RealVoiceAnalyzer:
                 "detection_method": "error_fallback"
             }
     
-    def _analyze_jitter(self, signal: np.ndarray, f0_analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """지터(Jitter) 분석 - 주기 간 변동"""
+    def _analyze_jitter(self, signal: np.ndarray, f0_analysis: Dict[str, Any],
+                        periods: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """지터(Jitter) 분석 - 주기 간 변동 (periods: _segment_periods 결과, 없으면 새로 분할)"""
         try:
             mean_f0 = f0_analysis["mean_f0"]
-            if mean_f0 <= 0:
-                return {"jitter_percent": 0.05, "jitter_abs": 0.001, "detection_method": "fallback"}
-            
-            # 주기 길이 계산
-            period_length = int(self.sample_rate / mean_f0)
+            if periods is None:
+                periods = self._segment_periods(signal, f0_analysis)
             
-            if period_length < 10:
+            if periods is None or len(periods) < 3:
                 return {"jitter_percent": 0.05, "jitter_abs": 0.001, "detection_method": "fallback"}
             
-            # 주기별 신호 분할
-            periods = []
-            for i in range(0, len(signal) - period_length, period_length):
-                period = signal[i:i+period_length]
-                if len(period) == period_length:
-                    periods.append(period)
-            
-            if len(periods) < 3:
-                return {"jitter_percent": 0.05, "jitter_abs": 0.001, "detection_method": "fallback"}
-            
-            # 주기 길이 변동 계산
-            period_lengths = []
-            for period in periods:
-                # 각 주기에서 피크 위치 찾기
-                peaks = self._find_peaks(period, min_distance=5)
-                if len(peaks) >= 2:
-                    period_lengths.append(peaks[-1] - peaks[0])
+            # 주기 길이 변동 계산 - 각 주기에서 첫 피크와 마지막 피크 사이 간격
+            period_lengths = self._period_peak_spans(periods, min_distance=5)
             
             if len(period_lengths) < 2:
                 return {"jitter_percent": 0.05, "jitter_abs": 0.001, "detection_method": "fallback"}
             
             # 지터 계산
-            period_lengths = np.array(period_lengths)
             jitter_abs = np.std(period_lengths) / self.sample_rate
             jitter_percent = (jitter_abs / (1/mean_f0)) * 100
             
@@ -269,40 +293,67 @@ class RealVoiceAnalyzer:
             logger.error(f"지터 분석 실패: {e}")
             return {"jitter_percent": 0.05, "jitter_abs": 0.001, "detection_method": "error_fallback"}
     
-    def _analyze_shimmer(self, signal: np.ndarray, f0_analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """시머(Shimmer) 분석 - 진폭 변동"""
+    def _segment_periods(self, signal: np.ndarray, f0_analysis: Dict[str, Any]) -> Optional[np.ndarray]:
+        """평균 F0 주기 길이로 신호를 분할 (F0가 유효하지 않거나 주기가 10샘플 미만이면 None)"""
+        mean_f0 = f0_analysis["mean_f0"]
+        if mean_f0 <= 0:
+            return None
+        
+        # 주기 길이 계산
+        period_length = int(self.sample_rate / mean_f0)
+        if period_length < 10:
+            return None
+        
+        # 주기별 신호 분할 (복사 없이 (주기 수, 주기 길이) 2차원 뷰로 재구성)
+        return self._split_periods(signal, period_length)
+    
+    def _split_periods(self, signal: np.ndarray, period_length: int) -> np.ndarray:
+        """신호를 period_length 길이의 연속 주기로 분할한 (주기 수, 주기 길이) 뷰 반환
+        
+        마지막 주기 시작점이 len(signal) - period_length 미만인 주기만 포함 (기존 분할 규칙과 동일)
+        """
+        num_periods = max(0, (len(signal) - 1) // period_length)
+        return signal[:num_periods * period_length].reshape(num_periods, period_length)
+    
+    def _period_peak_spans(self, periods: np.ndarray, min_distance: int) -> np.ndarray:
+        """주기별 첫 피크와 마지막 피크의 간격 (피크가 2개 이상인 주기만)"""
+        # 모든 주기의 극대점 후보를 한 번에 계산
+        center = periods[:, 1:-1]
+        rows, cols = np.nonzero((center > periods[:, :-2]) & (center > periods[:, 2:]))
+        cols += 1
+        
+        # 같은 주기 안에 min_distance보다 가까운 후보가 있거나, 인접 샘플 값이 같은 구간(평탄 피크 가능)이 있으면
+        # 엄격한 극대점만으로는 _find_peaks(평탄 구간 중앙도 피크로 인정)와 결과가 다를 수 있으므로 그 규칙을 그대로 적용
+        same_row = rows[1:] == rows[:-1]
+        has_plateau = np.any(periods[:, 1:] == periods[:, :-1])
+        if has_plateau or np.any(same_row & (np.diff(cols) < min_distance)):
+            spans = []
+            for period in periods:
+                peaks = self._find_peaks(period, min_distance=min_distance)
+                if len(peaks) >= 2:
+                    spans.append(peaks[-1] - peaks[0])
+            return np.array(spans)
+        
+        # 주기별 첫/마지막 후보 위치로 간격 계산
+        counts = np.bincount(rows, minlength=len(periods))
+        ends = np.cumsum(counts)
+        has_span = counts >= 2
+        return cols[ends[has_span] - 1] - cols[ends[has_span] - counts[has_span]]
+    
+    def _analyze_shimmer(self, signal: np.ndarray, f0_analysis: Dict[str, Any],
+                         periods: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """시머(Shimmer) 분석 - 진폭 변동 (periods: _segment_periods 결과, 없으면 새로 분할)"""
         try:
-            mean_f0 = f0_analysis["mean_f0"]
-            if mean_f0 <= 0:
-                return {"shimmer_percent": 0.08, "shimmer_db": 0.5, "detection_method": "fallback"}
-            
-            # 주기 길이 계산
-            period_length = int(self.sample_rate / mean_f0)
+            if periods is None:
+                periods = self._segment_periods(signal, f0_analysis)
             
-            if period_length < 10:
-                return {"shimmer_percent": 0.08, "shimmer_db": 0.5, "detection_method": "fallback"}
-            
-            # 주기별 신호 분할
-            periods = []
-            for i in range(0, len(signal) - period_length, period_length):
-                period = signal[i:i+period_length]
-                if len(period) == period_length:
-                    periods.append(period)
-            
-            if len(periods) < 3:
+            if periods is None or len(periods) < 3:
                 return {"shimmer_percent": 0.08, "shimmer_db": 0.5, "detection_method": "fallback"}
             
             # 주기별 진폭 계산
-            amplitudes = []
-            for period in periods:
-                amplitude = np.max(np.abs(period))
-                amplitudes.append(amplitude)
-            
-            if len(amplitudes) < 2:
-                return {"shimmer_percent": 0.08, "shimmer_db": 0.5, "detection_method": "fallback"}
+            amplitudes = np.abs(periods).max(axis=1)
             
             # 시머 계산
-            amplitudes = np.array(amplitudes)
             mean_amplitude = np.mean(amplitudes)
             shimmer_abs = np.std(amplitudes)
             shimmer_percent = (shimmer_abs / mean_amplitude) * 100
@@ -326,30 +377,25 @@ class RealVoiceAnalyzer:
             if mean_f0 <= 0:
                 return {"hnr_db": 15.0, "detection_method": "fallback"}
             
-            # FFT를 사용한 스펙트럼 분석
-            fft_signal = np.fft.fft(signal)
-            freqs = np.fft.fftfreq(len(signal), 1/self.sample_rate)
+            # rFFT를 사용한 스펙트럼 분석 (계산이 빠른 길이로 0 패딩)
+            n_fft = next_fast_len(len(signal), real=True)
+            fft_signal = rfft(signal, n=n_fft)
             
-            # 양의 주파수만 사용
-            positive_freqs = freqs[freqs > 0]
-            positive_fft = fft_signal[freqs > 0]
+            # 하모닉 성분과 노이즈 성분 분리 (DC 제외, 800 Hz 이하만 분석; 대역 주파수 축은 길이별로 캐시)
+            band_freqs = _hnr_band_frequencies(n_fft, self.sample_rate, self.voice_band[1])
+            band_fft = fft_signal[1:len(band_freqs) + 1]
             
             # 파워 스펙트럼
-            power_spectrum = np.abs(positive_fft) ** 2
-            
-            # 하모닉 성분과 노이즈 성분 분리
-            harmonic_power = 0
-            noise_power = 0
-            
-            # 기본주파수 주변의 하모닉 성분 찾기
-            for i, freq in enumerate(positive_freqs):
-                if freq < 800:  # 800 Hz 이하만 분석
-                    # 하모닉 주파수인지 확인
-                    harmonic_ratio = freq / mean_f0
-                    if abs(harmonic_ratio - round(harmonic_ratio)) < 0.1:  # 하모닉 허용 오차
-                        harmonic_power += power_spectrum[i]
-                    else:
-                        noise_power += power_spectrum[i]
+            power_spectrum = band_fft.real ** 2 + band_fft.imag ** 2
+            
+            # 기본주파수 주변의 하모닉 성분 찾기 (하모닉 허용 오차 0.1)
+            harmonic_ratio = band_freqs / mean_f0
+            is_harmonic = np.abs(harmonic_ratio - np.round(harmonic_ratio)) < 0.1
+            
+            # 하모닉/노이즈 파워를 한 번의 가중 합산으로 계산
+            noise_power, harmonic_power = np.bincount(
+                is_harmonic, weights=power_spectrum, minlength=2
+            )
             
             # HNR 계산
             if noise_power > 0:
@@ -375,9 +421,11 @@ class RealVoiceAnalyzer:
     def _assess_voice_quality(self, signal: np.ndarray, f0_analysis: Dict[str, Any]) -> str:
         """음성 품질 평가"""
         try:
-            # 1. 신호 대 노이즈 비율
-            signal_power = np.mean(signal ** 2)
-            noise_estimate = np.var(signal)
+            # 1. 신호 대 노이즈 비율 (제곱 평균은 내적으로, 분산은 제곱 평균 - 평균² 으로 임시 배열 없이 계산)
+            num_samples = len(signal)
+            signal_power = float(np.dot(signal, signal)) / num_samples
+            signal_mean = float(np.mean(signal))
+            noise_estimate = max(signal_power - signal_mean * signal_mean, 0.0)
             snr = 10 * np.log10(signal_power / (noise_estimate + 1e-10))
             
             # 2. F0 안정성
@@ -426,18 +474,8 @@ class RealVoiceAnalyzer:
     def _calculate_confidence(self, signal_quality: str, duration: float) -> float:
         """신뢰도 계산"""
         try:
-            base_confidence = 0.5
-            
             # 신호 품질 기반 신뢰도
-            quality_confidence = {
-                "Excellent": 0.95,
-                "Good": 0.85,
-                "Fair": 0.70,
-                "Poor": 0.50,
-                "Unknown": 0.60
-            }
-            
-            quality_score = quality_confidence.get(signal_quality, 0.60)
+            quality_score = self._QUALITY_CONFIDENCE.get(signal_quality, 0.60)
             
             # 길이 기반 신뢰도
             duration_confidence = min(1.0, duration / 3.0)  # 3초 기준
@@ -452,16 +490,10 @@ class RealVoiceAnalyzer:
             return 0.60
     
     def _find_peaks(self, signal: np.ndarray, min_distance: int = 5) -> np.ndarray:
-        """신호에서 피크 찾기"""
+        """신호에서 피크 찾기 (극대점 중 서로 min_distance 이상 떨어진 것, 가까우면 큰 피크 우선)"""
         try:
-            peaks = []
-            for i in range(1, len(signal) - 1):
-                if signal[i] > signal[i-1] and signal[i] > signal[i+1]:
-                    # 최소 거리 조건 확인
-                    if not peaks or i - peaks[-1] >= min_distance:
-                        peaks.append(i)
-            
-            return np.array(peaks)
+            peaks, _ = find_peaks(signal, distance=max(1, min_distance))
+            return peaks
             
         except Exception as e:
             logger.error(f"피크 검출 실패: {e}")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+실제 rPPG 엔진 신호 품질 게이트 테스트 스크립트
+
+얼굴 검출 단계는 합성 RGB 신호로 대체하고, 품질이 낮은 신호(잡음, 얼굴 미검출)에서는
+HRV/스트레스 분석을 생략하고 뚜렷한 맥파에서는 수행하는지 검증합니다.
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# 백엔드 경로 추가
+backend_path = Path(__file__).parent
+sys.path.append(str(backend_path))
+
+from app.services.real_rppg_engine import RealRPPGEngine
+
+SAMPLE_RATE = 30.0
+DURATION = 10.0
+NUM_FRAMES = int(SAMPLE_RATE * DURATION)
+
+def make_engine(rgb_signals):
+    """RGB 신호 추출 결과를 고정하고 HRV 계산 호출 횟수를 기록하는 엔진 생성"""
+    engine = RealRPPGEngine()
+    engine._extract_rgb_signals = lambda video_frames: rgb_signals
+
+    hrv_calls = []
+    calculate_hrv = engine._calculate_hrv
+
+    def counting_calculate_hrv(*args):
+        hrv_calls.append(args)
+        return calculate_hrv(*args)
+
+    engine._calculate_hrv = counting_calculate_hrv
+    return engine, hrv_calls
+
+def make_rgb_signals(pulse_amplitude, noise_level, seed=0):
+    """피부색 기준 밝기 + 72 BPM 맥파 + 가우시안 잡음으로 구성된 RGB 신호 생성"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(NUM_FRAMES) / SAMPLE_RATE
+    base = np.array([150.0, 110.0, 90.0])[:, None]
+    pulse = pulse_amplitude * np.array([0.3, 0.6, 0.2])[:, None] * np.sin(2 * np.pi * 1.2 * t)
+    rgb = base + pulse + noise_level * rng.standard_normal((3, NUM_FRAMES))
+    return dict(zip(('red', 'green', 'blue'), rgb.astype(np.float32)))
+
+def analyze(engine):
+    """형태만 맞춘 더미 프레임으로 분석 실행 (RGB 추출은 make_engine에서 대체됨)"""
+    frames = np.zeros((NUM_FRAMES, 1, 1, 3), dtype=np.uint8)
+    return engine.analyze_video_frames(frames, DURATION)
+
+def test_noise_skips_hrv():
+    """맥파 없는 잡음 신호는 Poor 등급으로 HRV/스트레스 분석 생략"""
+    engine, hrv_calls = make_engine(make_rgb_signals(pulse_amplitude=0.0, noise_level=1.0))
+    result = analyze(engine)
+
+    print(f"잡음 신호: 품질={result['signal_quality']} ({result['quality_score']:.2f})")
+    assert result['status'] == 'success'
+    assert result['quality_score'] < engine.min_quality_score
+    assert result['signal_quality'] == "Poor"
+    assert not hrv_calls
+    assert result['hrv'] == 0.0
+    assert result['stress_level'] == "알 수 없음"
+
+def test_no_face_skips_hrv():
+    """얼굴이 한 번도 검출되지 않으면 HRV 계산 없이 오류 결과 반환"""
+    empty = np.empty(0, dtype=np.float32)
+    engine, hrv_calls = make_engine({'red': empty, 'green': empty, 'blue': empty})
+    result = analyze(engine)
+
+    print(f"얼굴 미검출: 상태={result['status']}")
+    assert result['status'] == 'error'
+    assert not hrv_calls
+    assert result['hrv'] == 0.0
+
+def test_clear_pulse_runs_hrv():
+    """뚜렷한 맥파는 품질 게이트를 통과해 HRV/스트레스 분석 수행"""
+    engine, hrv_calls = make_engine(make_rgb_signals(pulse_amplitude=1.0, noise_level=0.02))
+    result = analyze(engine)
+
+    print(f"맥파 신호: HR={result['heart_rate']:.1f} BPM, 품질={result['signal_quality']} ({result['quality_score']:.2f})")
+    assert result['status'] == 'success'
+    assert result['quality_score'] >= engine.min_quality_score
+    assert len(hrv_calls) == 1
+    assert result['stress_level'] != "알 수 없음"
+    assert abs(result['heart_rate'] - 72.0) < 2.0
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    tests = [test_noise_skips_hrv, test_no_face_skips_hrv, test_clear_pulse_runs_hrv]
+    passed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print(f"✅ {test.__name__} 통과")
+        except AssertionError as e:
+            print(f"❌ {test.__name__} 실패: {e}")
+
+    print(f"🎯 테스트 결과: {passed}/{len(tests)} 통과")
+    return passed == len(tests)
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)